@@ -1,10 +1,20 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
+import numpy as np
+import shapely
 import geopandas as gpd
 import matplotlib.pyplot as plt
+from matplotlib import path as mpath
+from matplotlib.collections import LineCollection, PathCollection
 from matplotlib.ticker import MaxNLocator
 from matplotlib.font_manager import FontProperties
 
+# shared colorbar tick formatter, built once at import instead of per draw
+# (stateless, unlike a locator, which binds to one axis)
+_CBAR_FORMATTER = plt.FuncFormatter(lambda x, _: "{:,.0f}".format(x))
+
 
 class MapModel:
     """
@@ -33,30 +43,182 @@ class MapModel:
         Draw default Taiwan towns map
     """
 
+    # keys of self._map_range in the order _set_subset_map_range returns axes
+    _SUBSET_KEYS = (
+        "taiwan",
+        "penghu",
+        "kinmen",
+        "kinmen_wuqiu",
+        "lienchiang",
+        "lienchiang_dongyin",
+        "lienchiang_juguang",
+    )
+    # inset_axes bounds of each inset, ordered like _SUBSET_KEYS[1:]
+    _INSET_BOUNDS = (
+        [0.02, 0.25, 0.25, 0.40],  # penghu
+        [0.02, 0.58, 0.25, 0.25],  # kinmen
+        [0.22, 0.69, 0.06, 0.06],  # kinmen_wuqiu
+        [0.02, 0.734, 0.25, 0.25],  # lienchiang
+        [0.22, 0.87, 0.06, 0.06],  # lienchiang_dongyin
+        [0.22, 0.80, 0.06, 0.06],  # lienchiang_juguang
+    )
+
+    _CACHE_DIR = Path.home() / ".cache" / "simple-taiwan-map"
+
+    # set False to build the per-axes layers serially (e.g. for debugging)
+    parallel_render = True
+
     def __init__(self):
         self.crs = "WGS84"
-        self.county_gdf = gpd.read_file(
-            Path(__file__).parent / "shp" / "COUNTY_MOI_1090820.shp",
-            encoding="utf-8",
-            crs=self.crs,
-        )
-        self.town_gdf = gpd.read_file(
-            Path(__file__).parent / "shp" / "TOWN_MOI_1120825.shp",
-            encoding="utf-8",
-            crs=self.crs,
-        )
-        self.font = FontProperties(
-            fname=Path(__file__).parent / "font" / "Urbanist-VariableFont_wght.ttf"
-        )
+        self._fig_template = None
+        self._ax_home = None
+        self._ax_home_spec = None
+        self._cbar = None
+
+    @cached_property
+    def _map_range(self) -> dict:
+        """Map range config, loaded on first access."""
         with open(
             Path(__file__).parent / "config" / "map_range.json", "r", encoding="utf-8"
         ) as f:
-            self._map_range = json.load(f)
+            return json.load(f)
 
+    @cached_property
+    def _style_list(self) -> dict:
+        """Style config, loaded on first access."""
         with open(
             Path(__file__).parent / "config" / "style.json", "r", encoding="utf-8"
         ) as f:
-            self._style_list = json.load(f)
+            return json.load(f)
+
+    @cached_property
+    def county_gdf(self) -> gpd.GeoDataFrame:
+        """Taiwan counties GeoDataFrame, loaded and simplified on first access."""
+        gdf = self._load_gdf(Path(__file__).parent / "shp" / "COUNTY_MOI_1090820.shp")
+        gdf["geometry"] = gdf.geometry.simplify(
+            self._simplify_tolerance(), preserve_topology=True
+        )
+        return gdf
+
+    @cached_property
+    def town_gdf(self) -> gpd.GeoDataFrame:
+        """Taiwan towns GeoDataFrame, loaded and simplified on first access."""
+        gdf = self._load_gdf(Path(__file__).parent / "shp" / "TOWN_MOI_1120825.shp")
+        gdf["geometry"] = gdf.geometry.simplify(
+            self._simplify_tolerance(), preserve_topology=True
+        )
+        return gdf
+
+    @cached_property
+    def font(self) -> FontProperties:
+        """Font properties, loaded on first access."""
+        return FontProperties(
+            fname=Path(__file__).parent / "font" / "Urbanist-VariableFont_wght.ttf"
+        )
+
+    @cached_property
+    def _county_outline(self) -> gpd.GeoSeries:
+        """County boundary linework with duplicated shared edges merged.
+
+        Adjacent counties contribute the same border twice, once from each
+        side. Unioning the boundary lines nodes the linework and drops the
+        exact duplicates, roughly halving the segments handed to the
+        renderer while keeping the internal borders visible (a union of
+        the polygons would discard those entirely).
+        """
+        return gpd.GeoSeries(
+            [shapely.union_all(self.county_gdf.boundary.values)],
+            crs=self.county_gdf.crs,
+        )
+
+    @cached_property
+    def _town_boundary(self) -> gpd.GeoSeries:
+        """Town boundary GeoSeries."""
+        return self.town_gdf.boundary
+
+    def _load_gdf(self, shp_path: Path) -> gpd.GeoDataFrame:
+        """Load a shapefile, caching the parsed GeoDataFrame as feather.
+
+        Shapefile parsing dominates MapModel start-up, so the parsed frame
+        is written to ~/.cache/simple-taiwan-map once and read back (about
+        an order of magnitude faster) on later runs. The cache file name is
+        keyed on the mtime and size of the .shp and its .dbf attribute
+        sidecar, so editing either invalidates it.
+
+        Parameters:
+        -----------
+        shp_path : Path
+            The shapefile to load.
+
+        Returns:
+        --------
+        gdf : gpd.GeoDataFrame
+            The loaded GeoDataFrame.
+        """
+        sidecars = [shp_path, shp_path.with_suffix(".dbf")]
+        key = "-".join(
+            f"{stat.st_mtime_ns}-{stat.st_size}"
+            for stat in (path.stat() for path in sidecars if path.exists())
+        )
+        cache = self._CACHE_DIR / f"{shp_path.stem}-{key}.feather"
+        if cache.exists():
+            return gpd.read_feather(cache)
+
+        gdf = gpd.read_file(shp_path, encoding="utf-8", engine="pyogrio", use_arrow=True)
+        try:
+            self._CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            gdf.to_feather(cache)
+        except OSError:
+            # cache dir not writable; just skip caching
+            pass
+        return gdf
+
+    def _simplify_tolerance(self) -> float:
+        """Compute the geometry simplification tolerance in map units.
+
+        The shapefile coastlines are far denser than the output raster can
+        resolve. The tolerance is half a pixel at the most magnified view
+        (mainland or inset), so simplification is invisible in every axes.
+
+        Returns:
+        --------
+        tol : float
+            The tolerance to pass to GeoSeries.simplify.
+        """
+        style = self._style_list["default"]
+        fig_px = style["width"] * style["dpi"]
+        # fraction of the figure width each subset axes covers
+        fractions = (1.0,) + tuple(bounds[2] for bounds in self._INSET_BOUNDS)
+        deg_per_px = min(
+            (self._map_range[key]["max_x"] - self._map_range[key]["min_x"])
+            / (fig_px * frac)
+            for key, frac in zip(self._SUBSET_KEYS, fractions)
+        )
+        return deg_per_px / 2
+
+    @cached_property
+    def _geo_aspect(self) -> float:
+        """Axes aspect compensating for longitude shrink at Taiwan's latitude.
+
+        gdf.plot sets 1 / cos(mean latitude of the data) on every axes it
+        draws into; with collections added directly the same aspect has to
+        be set when the axes are built, or the maps stretch to fill the
+        axes boxes.
+        """
+        bounds = self.county_gdf.total_bounds
+        return 1 / np.cos(np.radians((bounds[1] + bounds[3]) / 2))
+
+    @cached_property
+    def _insets_spec(self) -> list:
+        """(inset_axes bounds, zoom-in range) pairs for each island inset.
+
+        Resolved once from the layout constants and map_range.json, so
+        _set_subset_map_range is a tight loop on every draw.
+        """
+        return [
+            (bounds, self._map_range[key])
+            for bounds, key in zip(self._INSET_BOUNDS, self._SUBSET_KEYS[1:])
+        ]
 
     def _inset_zoom_in_map(self, ax, bounds: list, zoom_in_range: dict) -> plt.Axes:
         """Set zoom in map range.
@@ -84,6 +246,7 @@ class MapModel:
         add_ax = ax.inset_axes(bounds)
         add_ax.set_xlim(zoom_in_range["min_x"], zoom_in_range["max_x"])
         add_ax.set_ylim(zoom_in_range["min_y"], zoom_in_range["max_y"])
+        add_ax.set_aspect(self._geo_aspect)
         add_ax.set_xticks([])
         add_ax.set_yticks([])
         return add_ax
@@ -104,56 +267,40 @@ class MapModel:
         subset_axes : list[plt.Axes]
             The list of Axes objects with the subset map range set.
         """
-        map_range = self._map_range
-
         # mainland range
-        ax.set_xlim(map_range["taiwan"]["min_x"], map_range["taiwan"]["max_x"])
-        ax.set_ylim(map_range["taiwan"]["min_y"], map_range["taiwan"]["max_y"])
-
-        # penghu range
-        pen = self._inset_zoom_in_map(ax, [0.02, 0.25, 0.25, 0.40], map_range["penghu"])
-
-        # kinmen range
-        kin = self._inset_zoom_in_map(ax, [0.02, 0.58, 0.25, 0.25], map_range["kinmen"])
-        kin_wuqiu = self._inset_zoom_in_map(
-            ax, [0.22, 0.69, 0.06, 0.06], map_range["kinmen_wuqiu"]
-        )
-
-        # lienchiang range
-        lie = self._inset_zoom_in_map(
-            ax, [0.02, 0.734, 0.25, 0.25], map_range["lienchiang"]
-        )
-        lie_dongyin = self._inset_zoom_in_map(
-            ax, [0.22, 0.87, 0.06, 0.06], map_range["lienchiang_dongyin"]
-        )
-        lie_juguang = self._inset_zoom_in_map(
-            ax, [0.22, 0.80, 0.06, 0.06], map_range["lienchiang_juguang"]
-        )
-        return [ax, pen, kin, kin_wuqiu, lie, lie_dongyin, lie_juguang]
-
-    def _colorbar(self, ax, vmin: float, vmax: float, cmap: str) -> plt.colorbar:
+        taiwan = self._map_range["taiwan"]
+        ax.set_xlim(taiwan["min_x"], taiwan["max_x"])
+        ax.set_ylim(taiwan["min_y"], taiwan["max_y"])
+        ax.set_aspect(self._geo_aspect)
+
+        # island insets
+        return [ax] + [
+            self._inset_zoom_in_map(ax, bounds, rng)
+            for bounds, rng in self._insets_spec
+        ]
+
+    def _colorbar(self, ax, norm: plt.Normalize, cmap) -> plt.colorbar:
         """Set colorbar.
 
-        This method sets the colorbar for the given Axes object.
+        This method sets the colorbar for the given Axes object. The norm
+        and colormap are the ones already used for the fill layer, so the
+        column is not normalized a second time.
 
         Parameters:
         -----------
         ax : plt.Axes
             The Axes object to set the colorbar for.
-        vmin : float
-            The minimum value of the colorbar.
-        vmax : float
-            The maximum value of the colorbar.
-        cmap : str
-            The colormap of the colorbar.
+        norm : plt.Normalize
+            The normalization shared with the fill layer.
+        cmap : matplotlib.colors.Colormap
+            The colormap shared with the fill layer.
 
         Returns:
         --------
         cbar : plt.colorbar
             The colorbar object.
         """
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(vmin=vmin, vmax=vmax))
-        sm._A = []
+        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
         cbar = plt.colorbar(sm, ax=ax, orientation="vertical", pad=-0.05, shrink=0.5)
 
         # set tricks label font family
@@ -161,12 +308,326 @@ class MapModel:
             label.set_fontproperties(self.font)
 
         cbar.ax.tick_params(labelsize=12)
-        cbar.formatter = plt.FuncFormatter(lambda x, _: "{:,.0f}".format(x))
+        cbar.formatter = _CBAR_FORMATTER
         cbar.locator = MaxNLocator(nbins=6)
         return cbar
 
+    @staticmethod
+    def _polygon_paths(geoms) -> list[mpath.Path]:
+        """Convert polygon geometries to matplotlib compound paths.
+
+        One compound path is built per geometry (all parts and interior
+        rings included), so the returned list aligns with the rows of the
+        source GeoDataFrame. The rings and their coordinates are pulled
+        out with bulk shapely calls instead of per-polygon Python
+        accessors.
+
+        Parameters:
+        -----------
+        geoms : gpd.GeoSeries
+            The polygon geometries to convert.
+
+        Returns:
+        --------
+        paths : list[mpath.Path]
+            One compound path per geometry.
+        """
+        parts, part_rows = shapely.get_parts(geoms.values, return_index=True)
+        # matplotlib fills compound paths with the nonzero winding rule, so
+        # interior rings only render as holes when they wind opposite to
+        # their exterior; the source data does not guarantee that
+        parts = shapely.orient_polygons(parts)
+        rings = [shapely.get_exterior_ring(parts)]
+        ring_rows = [part_rows]
+        n_interiors = shapely.get_num_interior_rings(parts)
+        for i in range(np.max(n_interiors, initial=0)):
+            has = n_interiors > i
+            rings.append(shapely.get_interior_ring(parts[has], i))
+            ring_rows.append(part_rows[has])
+        ring_rows = np.concatenate(ring_rows)
+        order = np.argsort(ring_rows, kind="stable")
+        coord_rows = ring_rows[order]
+
+        coords, ring_idx = shapely.get_coordinates(
+            np.concatenate(rings)[order], return_index=True
+        )
+        codes = np.full(len(coords), mpath.Path.LINETO, dtype=mpath.Path.code_type)
+        codes[np.flatnonzero(np.diff(ring_idx, prepend=-1))] = mpath.Path.MOVETO
+
+        row_offsets = np.flatnonzero(np.diff(coord_rows[ring_idx])) + 1
+        paths = [mpath.Path(np.empty((0, 2)))] * len(geoms)
+        for row, verts, ring_codes in zip(
+            np.unique(coord_rows),
+            np.split(coords, row_offsets),
+            np.split(codes, row_offsets),
+        ):
+            paths[row] = mpath.Path(verts, ring_codes)
+        return paths
+
+    @staticmethod
+    def _boundary_segments(boundary) -> list[np.ndarray]:
+        """Extract line coordinate arrays from a boundary GeoSeries.
+
+        All coordinates are pulled out in one bulk shapely call and split
+        at the line-part offsets, instead of looping over geometries in
+        Python.
+
+        Parameters:
+        -----------
+        boundary : gpd.GeoSeries
+            The boundary (LineString/MultiLineString) geometries.
+
+        Returns:
+        --------
+        segments : list[np.ndarray]
+            One (N, 2) coordinate array per line part.
+        """
+        lines = shapely.get_parts(boundary.values)
+        coords, line_idx = shapely.get_coordinates(lines, return_index=True)
+        # the renderer only needs pixel precision; float32 halves the
+        # resident size of the cached segment lists
+        coords = coords.astype(np.float32)
+        offsets = np.flatnonzero(np.diff(line_idx)) + 1
+        return np.split(coords, offsets)
+
+    @staticmethod
+    def _segment_bounds(segments: list) -> np.ndarray:
+        """Compute the (min_x, min_y, max_x, max_y) bounds of each segment."""
+        bounds = np.empty((len(segments), 4))
+        for i, seg in enumerate(segments):
+            bounds[i, :2] = seg.min(axis=0)
+            bounds[i, 2:] = seg.max(axis=0)
+        return bounds
+
+    @staticmethod
+    def _clip_segments(segments: list, bounds: np.ndarray, window: tuple) -> list:
+        """Keep the segments whose bounds intersect a subset window."""
+        min_x, min_y, max_x, max_y = window
+        keep = (
+            (bounds[:, 0] <= max_x)
+            & (bounds[:, 2] >= min_x)
+            & (bounds[:, 1] <= max_y)
+            & (bounds[:, 3] >= min_y)
+        )
+        return [seg for seg, k in zip(segments, keep) if k]
+
+    def _bake_subset_segments(self, boundary) -> list[list[np.ndarray]]:
+        """Pre-clip a boundary layer to every subset window.
+
+        The subset windows are static (they come from map_range.json), so
+        the clipped segment lists can be computed once per model instead
+        of on every draw.
+
+        Parameters:
+        -----------
+        boundary : gpd.GeoSeries
+            The boundary geometries to extract and clip.
+
+        Returns:
+        --------
+        subsets : list[list[np.ndarray]]
+            One segment list per subset axes, ordered like _SUBSET_KEYS.
+        """
+        segments = self._boundary_segments(boundary)
+        bounds = self._segment_bounds(segments)
+        return [
+            segments if window is None else self._clip_segments(
+                segments, bounds, window
+            )
+            for window in self._subset_windows
+        ]
+
+    @cached_property
+    def _county_subset_segments(self) -> list[list[np.ndarray]]:
+        """County boundary segments pre-clipped to each subset window."""
+        return self._bake_subset_segments(self._county_outline)
+
+    @cached_property
+    def _town_subset_segments(self) -> list[list[np.ndarray]]:
+        """Town boundary segments pre-clipped to each subset window."""
+        return self._bake_subset_segments(self._town_boundary)
+
+    @cached_property
+    def _subset_boxes(self) -> list:
+        """Shapely boxes of each subset window, ordered like _SUBSET_KEYS.
+
+        The mainland entry is None, meaning "no clipping".
+        """
+        return [
+            None if window is None else shapely.box(*window)
+            for window in self._subset_windows
+        ]
+
+    def _subset_indices(self, tree: shapely.STRtree) -> list:
+        """Query the row indices visible in each subset axes.
+
+        The mainland axes shows (almost) everything, so its entry is None
+        meaning "all rows"; each inset gets the integer positions of the
+        rows intersecting its zoom-in window.
+
+        Parameters:
+        -----------
+        tree : shapely.STRtree
+            An STRtree over the GeoDataFrame's geometry array.
+
+        Returns:
+        --------
+        indices : list
+            One entry per subset axes, ordered like _SUBSET_KEYS.
+        """
+        return [
+            None if box is None else tree.query(box, predicate="intersects")
+            for box in self._subset_boxes
+        ]
+
+    @cached_property
+    def _subset_windows(self) -> list:
+        """Bounding boxes of each subset axes, ordered like _SUBSET_KEYS.
+
+        The mainland entry is None, meaning "no clipping".
+
+        Returns:
+        --------
+        windows : list
+            One (min_x, min_y, max_x, max_y) tuple (or None) per subset
+            axes.
+        """
+        windows = [None]
+        for key in self._SUBSET_KEYS[1:]:
+            rng = self._map_range[key]
+            windows.append((rng["min_x"], rng["min_y"], rng["max_x"], rng["max_y"]))
+        return windows
+
+    @staticmethod
+    def _fill_collection(
+        paths: list, facecolors: np.ndarray, idx=None, **kwargs
+    ) -> PathCollection:
+        """Build the choropleth fill layer for one axes.
+
+        Parameters:
+        -----------
+        paths : list
+            Compound paths from _polygon_paths, one per row.
+        facecolors : np.ndarray
+            RGBA facecolors, one per row.
+        idx : np.ndarray, optional
+            Row positions to keep (from _subset_indices); None keeps all.
+
+        Returns:
+        --------
+        fill : PathCollection
+            The fill collection. Path objects are shared between axes.
+        """
+        if idx is not None:
+            paths = [paths[i] for i in idx]
+            facecolors = facecolors[idx]
+        return PathCollection(
+            paths,
+            facecolors=facecolors,
+            edgecolors="none",
+            rasterized=True,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _boundary_collection(segments: list, **kwargs) -> LineCollection:
+        """Build a boundary layer for one axes.
+
+        Parameters:
+        -----------
+        segments : list
+            Coordinate arrays, already clipped to the axes' subset window
+            (see _bake_subset_segments).
+
+        Returns:
+        --------
+        boundary : LineCollection
+            The boundary collection. Segment arrays are shared between axes.
+        """
+        return LineCollection(segments, rasterized=True, **kwargs)
+
+    def _figure(self, reuse_figure: bool) -> tuple:
+        """Get the figure, mainland axes and subset axes to draw into.
+
+        With reuse_figure, one template figure with the mainland axes and
+        the six insets is built lazily, kept on the model, and cleared
+        between renders — batch rendering skips matplotlib's per-call
+        figure and inset construction entirely. Pass reuse_figure=False
+        to get an independent figure, e.g. to keep several drawn maps
+        alive at once.
+
+        Parameters:
+        -----------
+        reuse_figure : bool
+            Whether to use (and keep) the shared template figure.
+
+        Returns:
+        --------
+        fig : plt.Figure
+            The Figure object.
+        ax : plt.Axes
+            The mainland Axes object.
+        subset_axes : list[plt.Axes]
+            All subset axes, ordered like _SUBSET_KEYS.
+        """
+        if reuse_figure and self._fig_template is not None:
+            fig, ax, subset_axes = self._fig_template
+            for axes in subset_axes:
+                for artist in list(axes.collections):
+                    artist.remove()
+            if self._cbar is not None:
+                self._cbar.remove()
+                self._cbar = None
+                # colorbar creation stole width from ax (nesting a new
+                # gridspec) and remove() does not give it back; restore
+                # the pristine layout so reuse doesn't shrink the map
+                ax.set_subplotspec(self._ax_home_spec)
+                ax.set_position(self._ax_home)
+            return fig, ax, subset_axes
+
+        style = self._style_list["default"]
+        fig, ax = plt.subplots(
+            figsize=(style["width"], style["height"]), dpi=style["dpi"]
+        )
+        ax.axis("off")
+        subset_axes = self._set_subset_map_range(ax)
+        if reuse_figure:
+            self._fig_template = (fig, ax, subset_axes)
+            self._ax_home = ax.get_position().frozen()
+            self._ax_home_spec = ax.get_subplotspec()
+        return fig, ax, subset_axes
+
+    def _render_subsets(self, render_one, tasks) -> None:
+        """Run the per-axes render function over every subset axes.
+
+        With parallel_render set, the seven axes are rendered on a thread
+        pool: the numpy/shapely work behind each collection releases the
+        GIL and every worker touches a different axes. The collections are
+        only attached here; the figure itself is rasterized later on the
+        caller's thread.
+
+        Parameters:
+        -----------
+        render_one : callable
+            Builds and attaches the collections for one task tuple.
+        tasks : iterable
+            One task tuple per subset axes.
+        """
+        tasks = list(tasks)
+        if self.parallel_render:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+                for _ in pool.map(render_one, tasks):
+                    pass
+        else:
+            for task in tasks:
+                render_one(task)
+
     def draw_counties_map(
-        self, gdf: gpd.GeoDataFrame = None, col: str = None, cmap: str = None
+        self,
+        gdf: gpd.GeoDataFrame = None,
+        col: str = None,
+        cmap: str = None,
+        reuse_figure: bool = True,
     ):
         """
         Draw Taiwan counties map.
@@ -181,6 +642,9 @@ class MapModel:
             The column to plot.
         cmap : str
             The colormap to use.
+        reuse_figure : bool
+            Draw into the shared template figure, clearing the previous
+            render. Pass False to get an independent figure.
 
         Returns:
         --------
@@ -189,23 +653,49 @@ class MapModel:
         ax : plt.Axes
             The Axes object.
         """
-        style = self._style_list["default"]
-        fig, ax = plt.subplots(
-            figsize=(style["width"], style["height"]), dpi=style["dpi"]
-        )
-        ax.axis("off")
+        fig, ax, subset_axes = self._figure(reuse_figure)
 
-        subset_axes = self._set_subset_map_range(ax)
+        county_subsets = self._county_subset_segments
 
         if all([gdf is not None, col is not None]):
             cmap = cmap if cmap else "YlGn"
-            for axes in subset_axes:
-                gdf.plot(ax=axes, column=col, cmap=cmap, legend=False)
-                self.county_gdf.boundary.plot(ax=axes, linewidth=0.8, color="black")
-            self._colorbar(ax, gdf[col].min(), gdf[col].max(), cmap)
+            vals = gdf[col].to_numpy()
+            cm = plt.get_cmap(cmap)
+            norm = plt.Normalize(np.nanmin(vals), np.nanmax(vals))
+            facecolors = cm(norm(vals))
+            paths = self._polygon_paths(gdf.geometry)
+            fill_idx = self._subset_indices(shapely.STRtree(gdf.geometry.values))
+
+            def render_one(task):
+                axes, f_idx, county_segs = task
+                axes.add_collection(
+                    self._fill_collection(paths, facecolors, f_idx, zorder=1)
+                )
+                axes.add_collection(
+                    self._boundary_collection(
+                        county_segs, linewidths=0.8, colors="black", zorder=2
+                    )
+                )
+
+            self._render_subsets(
+                render_one, zip(subset_axes, fill_idx, county_subsets)
+            )
+            cbar = self._colorbar(ax, norm, cm)
+            if reuse_figure:
+                # only the template's colorbar is tracked for removal on
+                # the next reused draw; independent figures keep theirs
+                self._cbar = cbar
         else:
-            for axes in subset_axes:
-                self.county_gdf.boundary.plot(ax=axes, linewidth=0.8, color="black")
+
+            def render_one(task):
+                axes, county_segs = task
+                axes.add_collection(
+                    self._boundary_collection(
+                        county_segs, linewidths=0.8, colors="black", zorder=2
+                    )
+                )
+
+            self._render_subsets(render_one, zip(subset_axes, county_subsets))
 
         return fig, ax
 
@@ -214,7 +704,11 @@ class MapModel:
         return self.draw_counties_map()
 
     def draw_towns_map(
-        self, gdf: gpd.GeoDataFrame = None, col: str = None, cmap: str = None
+        self,
+        gdf: gpd.GeoDataFrame = None,
+        col: str = None,
+        cmap: str = None,
+        reuse_figure: bool = True,
     ):
         """Draw Taiwan towns map.
 
@@ -228,6 +722,9 @@ class MapModel:
             The column to plot.
         cmap : str
             The colormap to use.
+        reuse_figure : bool
+            Draw into the shared template figure, clearing the previous
+            render. Pass False to get an independent figure.
 
         Returns:
         --------
@@ -236,31 +733,72 @@ class MapModel:
         ax : plt.Axes
             The Axes object.
         """
-        style = self._style_list["default"]
-        fig, ax = plt.subplots(
-            figsize=(style["width"], style["height"]), dpi=style["dpi"]
-        )
-        ax.axis("off")
+        fig, ax, subset_axes = self._figure(reuse_figure)
 
-        subset_axes = self._set_subset_map_range(ax)
+        town_subsets = self._town_subset_segments
+        county_subsets = self._county_subset_segments
 
         if all([gdf is not None, col is not None]):
             cmap = cmap if cmap else "YlGn"
-            for axes in subset_axes:
-                self.town_gdf.boundary.plot(
-                    ax=axes, linewidth=0.2, color="black", alpha=0.5, zorder=1
+            vals = gdf[col].to_numpy()
+            cm = plt.get_cmap(cmap)
+            norm = plt.Normalize(np.nanmin(vals), np.nanmax(vals))
+            facecolors = cm(norm(vals))
+            paths = self._polygon_paths(gdf.geometry)
+            fill_idx = self._subset_indices(shapely.STRtree(gdf.geometry.values))
+
+            def render_one(task):
+                axes, f_idx, town_segs, county_segs = task
+                axes.add_collection(
+                    self._boundary_collection(
+                        # gray = black at 50% over the white background,
+                        # pre-blended so Agg can use opaque line stroking
+                        town_segs,
+                        linewidths=0.2,
+                        colors=(0.5, 0.5, 0.5),
+                        zorder=1,
+                    )
+                )
+                axes.add_collection(
+                    self._fill_collection(paths, facecolors, f_idx, zorder=2)
                 )
-                gdf.plot(ax=axes, column=col, cmap=cmap, legend=False, zorder=2)
-                self.county_gdf.boundary.plot(
-                    ax=axes, linewidth=0.8, color="black", zorder=3
+                axes.add_collection(
+                    self._boundary_collection(
+                        county_segs, linewidths=0.8, colors="black", zorder=3
+                    )
                 )
-            self._colorbar(ax, gdf[col].min(), gdf[col].max(), cmap)
+
+            self._render_subsets(
+                render_one, zip(subset_axes, fill_idx, town_subsets, county_subsets)
+            )
+            cbar = self._colorbar(ax, norm, cm)
+            if reuse_figure:
+                # only the template's colorbar is tracked for removal on
+                # the next reused draw; independent figures keep theirs
+                self._cbar = cbar
         else:
-            for axes in subset_axes:
-                self.town_gdf.boundary.plot(
-                    ax=axes, linewidth=0.2, color="black", alpha=0.5
+
+            def render_one(task):
+                axes, town_segs, county_segs = task
+                axes.add_collection(
+                    self._boundary_collection(
+                        # gray = black at 50% over the white background,
+                        # pre-blended so Agg can use opaque line stroking
+                        town_segs,
+                        linewidths=0.2,
+                        colors=(0.5, 0.5, 0.5),
+                        zorder=1,
+                    )
                 )
-                self.county_gdf.boundary.plot(ax=axes, linewidth=0.8, color="black")
+                axes.add_collection(
+                    self._boundary_collection(
+                        county_segs, linewidths=0.8, colors="black", zorder=3
+                    )
+                )
+
+            self._render_subsets(
+                render_one, zip(subset_axes, town_subsets, county_subsets)
+            )
 
         return fig, ax
 